@@ -6,19 +6,26 @@ from contextlib import asynccontextmanager
 import logging
 
 from config import get_settings
+from domains.shopify.services.carts import CartService
+from domains.voice.agent.optimized_agent import VoiceAgentHandler
 from integrations.shopify.client import ShopifyClient
+from integrations.retell.client import RetellClient
 
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
 shopify_client = None
+retell_client = None
+# Shared for the app lifetime so in-memory carts survive across requests
+cart_service = None
+voice_handler = None
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
-    global shopify_client
+    global shopify_client, retell_client, cart_service, voice_handler
     
     logger.info("Starting Backend Service")
     
@@ -27,6 +34,9 @@ async def lifespan(app: FastAPI):
         access_token=settings.shopify_access_token,
         api_version=settings.shopify_api_version
     )
+    cart_service = CartService(shopify_client, max_carts=settings.max_carts)
+    voice_handler = VoiceAgentHandler(shopify_client, cart_service=cart_service)
+    retell_client = RetellClient()
     
     yield
     
@@ -34,6 +44,8 @@ async def lifespan(app: FastAPI):
     
     if shopify_client:
         await shopify_client.close()
+    if retell_client:
+        await retell_client.close()
 
 
 def create_app() -> FastAPI:
@@ -38,6 +38,9 @@ class Settings(BaseSettings):
     # Session
     session_ttl: int = Field(default=3600, alias="SESSION_TTL")
     
+    # Carts (unbounded unless set)
+    max_carts: Optional[int] = Field(default=None, alias="MAX_CARTS")
+    
     class Config:
         """Pydantic configuration."""
         env_file = Path(__file__).parent.parent / ".env"
@@ -1,6 +1,6 @@
 """Shopify domain API routes."""
 
-from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from typing import Dict, Any, List, Optional
 from pydantic import BaseModel
 import logging
@@ -28,6 +28,14 @@ class CartItemRequest(BaseModel):
     product_id: Optional[str] = None
 
 
+def get_cart_service() -> CartService:
+    """Return the app-wide cart service, or 503 before startup has run."""
+    from app import cart_service
+    if cart_service is None:
+        raise HTTPException(status_code=503, detail="Cart service not initialized")
+    return cart_service
+
+
 @router.get("/products")
 async def get_products(
     request: Request,
@@ -157,30 +165,24 @@ async def get_collections(request: Request) -> Dict[str, Any]:
 @router.post("/carts")
 async def create_cart(
     request: Request,
-    items: List[CartItemRequest] = None
+    items: List[CartItemRequest] = None,
+    cart_service: CartService = Depends(get_cart_service)
 ) -> Dict[str, Any]:
     """Create a new cart."""
-    from app import shopify_client
-    service = CartService(shopify_client)
+    cart_items = [item.model_dump() for item in items] if items else []
     
-    cart_items = []
-    if items:
-        for item in items:
-            cart_items.append(item.dict())
-    
-    cart = await service.create_cart(cart_items)
+    cart = await cart_service.create_cart(cart_items)
     return cart
 
 
 @router.get("/carts/{cart_id}")
 async def get_cart(
     request: Request,
-    cart_id: str
+    cart_id: str,
+    cart_service: CartService = Depends(get_cart_service)
 ) -> Dict[str, Any]:
     """Get a cart."""
-    from app import shopify_client
-    service = CartService(shopify_client)
-    cart = await service.get_cart(cart_id)
+    cart = await cart_service.get_cart(cart_id)
     
     if not cart:
         raise HTTPException(status_code=404, detail="Cart not found")
@@ -192,12 +194,11 @@ async def get_cart(
 async def add_to_cart(
     request: Request,
     cart_id: str,
-    item: CartItemRequest
+    item: CartItemRequest,
+    cart_service: CartService = Depends(get_cart_service)
 ) -> Dict[str, Any]:
     """Add item to cart."""
-    from app import shopify_client
-    service = CartService(shopify_client)
-    cart = await service.add_to_cart(
+    cart = await cart_service.add_to_cart(
         cart_id=cart_id,
         variant_id=item.variant_id,
         quantity=item.quantity,
@@ -214,12 +215,11 @@ async def add_to_cart(
 async def remove_from_cart(
     request: Request,
     cart_id: str,
-    variant_id: str
+    variant_id: str,
+    cart_service: CartService = Depends(get_cart_service)
 ) -> Dict[str, Any]:
     """Remove item from cart."""
-    from app import shopify_client
-    service = CartService(shopify_client)
-    cart = await service.remove_from_cart(cart_id, variant_id)
+    cart = await cart_service.remove_from_cart(cart_id, variant_id)
     
     if not cart:
         raise HTTPException(status_code=404, detail="Cart not found")
@@ -230,12 +230,11 @@ async def remove_from_cart(
 @router.post("/carts/{cart_id}/checkout")
 async def checkout_cart(
     request: Request,
-    cart_id: str
+    cart_id: str,
+    cart_service: CartService = Depends(get_cart_service)
 ) -> Dict[str, Any]:
     """Checkout cart to draft order."""
-    from app import shopify_client
-    service = CartService(shopify_client)
-    result = await service.checkout_cart(cart_id)
+    result = await cart_service.checkout_cart(cart_id)
     
     if result.get("error"):
         raise HTTPException(status_code=400, detail=result["error"])
@@ -1,7 +1,9 @@
 """Cart service for Shopify domain."""
 
 from typing import Dict, Any, List, Optional
+import asyncio
 import logging
+import secrets
 from datetime import datetime
 from integrations.shopify.client import ShopifyClient
 
@@ -12,9 +14,16 @@ logger = logging.getLogger(__name__)
 class CartService:
     """Service for cart-related operations."""
     
-    def __init__(self, shopify_client: ShopifyClient):
+    def __init__(
+        self,
+        shopify_client: ShopifyClient,
+        max_carts: Optional[int] = None
+    ):
         self.client = shopify_client
-        # In-memory cart storage (in production, use Redis or database)
+        # Opt-in cap; past it the least recently used cart is evicted
+        self.max_carts = max_carts
+        # In-memory cart storage (in production, use Redis or database),
+        # ordered from least to most recently used
         self.carts: Dict[str, Dict[str, Any]] = {}
     
     async def create_cart(
@@ -22,26 +31,26 @@ class CartService:
         items: List[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Create a new cart."""
-        import uuid
-        cart_id = str(uuid.uuid4())
+        cart_id = secrets.token_hex(16)
+        now = datetime.utcnow().isoformat()
         
         cart = {
             "id": cart_id,
             "items": items or [],
-            "created_at": datetime.utcnow().isoformat(),
-            "updated_at": datetime.utcnow().isoformat(),
+            "created_at": now,
+            "updated_at": now,
             "total": 0.0
         }
         
         if items:
             cart = await self._calculate_cart_total(cart)
         
-        self.carts[cart_id] = cart
+        self._store_cart(cart)
         return cart
     
     async def get_cart(self, cart_id: str) -> Optional[Dict[str, Any]]:
         """Get a cart by ID."""
-        return self.carts.get(cart_id)
+        return self._touch_cart(cart_id)
     
     async def update_cart(
         self,
@@ -57,7 +66,7 @@ class CartService:
         cart["updated_at"] = datetime.utcnow().isoformat()
         cart = await self._calculate_cart_total(cart)
         
-        self.carts[cart_id] = cart
+        self._store_cart(cart)
         return cart
     
     async def add_to_cart(
@@ -110,7 +119,7 @@ class CartService:
         cart["updated_at"] = datetime.utcnow().isoformat()
         cart = await self._calculate_cart_total(cart)
         
-        self.carts[cart_id] = cart
+        self._store_cart(cart)
         return cart
     
     async def remove_from_cart(
@@ -131,7 +140,7 @@ class CartService:
         cart["updated_at"] = datetime.utcnow().isoformat()
         cart = await self._calculate_cart_total(cart)
         
-        self.carts[cart_id] = cart
+        self._store_cart(cart)
         return cart
     
     async def checkout_cart(
@@ -139,7 +148,7 @@ class CartService:
         cart_id: str
     ) -> Dict[str, Any]:
         """Convert cart to a draft order."""
-        cart = self.carts.get(cart_id)
+        cart = self._touch_cart(cart_id)
         if not cart:
             return {"error": "Cart not found"}
         
@@ -160,31 +169,54 @@ class CartService:
         
         if not draft_order.get("error"):
             # Clear the cart after successful checkout
-            del self.carts[cart_id]
+            self.carts.pop(cart_id, None)
         
         return draft_order
     
+    def _touch_cart(self, cart_id: str) -> Optional[Dict[str, Any]]:
+        """Return a cart and mark it as most recently used."""
+        cart = self.carts.pop(cart_id, None)
+        if cart is not None:
+            self.carts[cart_id] = cart
+        return cart
+    
+    def _store_cart(self, cart: Dict[str, Any]) -> None:
+        """Store a cart as most recently used, evicting the oldest past the cap."""
+        self.carts.pop(cart["id"], None)
+        self.carts[cart["id"]] = cart
+        
+        if self.max_carts is not None and len(self.carts) > self.max_carts:
+            evicted_id = next(iter(self.carts))
+            del self.carts[evicted_id]
+            logger.info(f"Evicted cart {evicted_id}: over {self.max_carts} carts")
+    
     async def _calculate_cart_total(
         self,
         cart: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Calculate cart total."""
-        total = 0.0
+        # Fetch each product missing a cached price once, concurrently
+        product_ids = list({
+            item["product_id"] for item in cart["items"]
+            if "price" not in item and item.get("product_id")
+        })
+        products = await asyncio.gather(
+            *(self.client.get_product(product_id) for product_id in product_ids)
+        )
+        products_by_id = dict(zip(product_ids, products))
         
         for item in cart["items"]:
-            if "price" in item:
-                total += item["price"] * item["quantity"]
-            else:
-                # Try to fetch price if not cached
-                if item.get("product_id"):
-                    product = await self.client.get_product(item["product_id"])
-                    if product:
-                        for variant in product.get("variants", []):
-                            if str(variant.get("id")) == str(item["variant_id"]):
-                                price = float(variant.get("price", 0))
-                                item["price"] = price
-                                total += price * item["quantity"]
-                                break
-        
-        cart["total"] = total
+            if "price" not in item:
+                product = products_by_id.get(item.get("product_id"))
+                if product:
+                    for variant in product.get("variants", []):
+                        if str(variant.get("id")) == str(item["variant_id"]):
+                            item["price"] = float(variant.get("price", 0))
+                            break
+        
+        cart["total"] = sum(
+            (item["price"] * item["quantity"]
+             for item in cart["items"] if "price" in item),
+            0.0
+        )
         return cart
\ No newline at end of file
@@ -1,6 +1,8 @@
 """Product service for Shopify domain."""
 
 from typing import List, Dict, Any, Optional
+from operator import itemgetter
+import heapq
 import logging
 from integrations.shopify.client import ShopifyClient
 
@@ -27,7 +29,7 @@ class ProductService:
         product = await self.client.get_product(product_id)
         
         if product and include_inventory:
-            inventory = await self.client.check_inventory(product_id)
+            inventory = await self.client.check_inventory(product_id, product=product)
             product["inventory"] = inventory
         
         return product
@@ -43,26 +45,21 @@ class ProductService:
         
         # Apply additional filters if provided
         if filters:
+            has_price_filter = "min_price" in filters or "max_price" in filters
             filtered_products = []
             for product in products:
                 match = True
                 
-                if "min_price" in filters:
-                    variants = product.get("variants", [])
-                    if variants:
-                        min_product_price = min(
-                            float(v.get("price", 0)) for v in variants
-                        )
-                        if min_product_price < filters["min_price"]:
+                if has_price_filter:
+                    # Parse variant prices once for both bounds
+                    prices = [
+                        float(v.get("price", 0)) for v in product.get("variants", [])
+                    ]
+                    if prices and "min_price" in filters:
+                        if min(prices) < filters["min_price"]:
                             match = False
-                
-                if "max_price" in filters:
-                    variants = product.get("variants", [])
-                    if variants:
-                        max_product_price = max(
-                            float(v.get("price", 0)) for v in variants
-                        )
-                        if max_product_price > filters["max_price"]:
+                    if prices and "max_price" in filters:
+                        if max(prices) > filters["max_price"]:
                             match = False
                 
                 if "vendor" in filters and product.get("vendor") != filters["vendor"]:
@@ -109,6 +106,6 @@ class ProductService:
             if score > 0:
                 recommendations.append((score, p))
         
-        # Sort by score and return top recommendations
-        recommendations.sort(key=lambda x: x[0], reverse=True)
-        return [p for _, p in recommendations[:limit]]
\ No newline at end of file
+        # Select the top recommendations by score without sorting them all
+        top = heapq.nlargest(limit, recommendations, key=itemgetter(0))
+        return [p for _, p in top]
\ No newline at end of file
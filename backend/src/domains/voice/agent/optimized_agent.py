@@ -1,25 +1,43 @@
 """Voice agent handler for Retell AI integration."""
 
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 import logging
 
 from domains.shopify.services.products import ProductService
 from domains.shopify.services.inventory import InventoryService
 from domains.shopify.services.carts import CartService
+from integrations.retell.client import loggable_parameters
 from integrations.shopify.client import ShopifyClient
 
 
 logger = logging.getLogger(__name__)
 
+# Tool name -> handler method, resolved with a single dict lookup per call
+_TOOL_HANDLERS: Mapping[str, str] = MappingProxyType({
+    "get_product_catalog": "_get_product_catalog",
+    "get_product_details": "_get_product_details",
+    "check_inventory": "_check_inventory",
+    "search_products": "_search_products",
+    "create_cart": "_create_cart",
+    "update_cart": "_update_cart",
+})
+
 
 class VoiceAgentHandler:
     """Handles tool execution for voice agent."""
     
-    def __init__(self, shopify_client: ShopifyClient):
+    def __init__(
+        self,
+        shopify_client: ShopifyClient,
+        cart_service: Optional[CartService] = None
+    ):
         self.shopify_client = shopify_client
         self.product_service = ProductService(shopify_client)
         self.inventory_service = InventoryService(shopify_client)
-        self.cart_service = CartService(shopify_client)
+        self.cart_service = (
+            cart_service if cart_service is not None else CartService(shopify_client)
+        )
     
     async def execute_tool(
         self,
@@ -27,26 +45,22 @@ class VoiceAgentHandler:
         parameters: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Execute a tool and return the result."""
-        logger.info(f"Executing tool: {tool_name} with params: {parameters}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Executing tool: %s with params: %s",
+                tool_name,
+                loggable_parameters(parameters)
+            )
+        
+        handler_name = _TOOL_HANDLERS.get(tool_name)
+        if handler_name is None:
+            return {
+                "success": False,
+                "error": f"Unknown tool: {tool_name}"
+            }
         
         try:
-            if tool_name == "get_product_catalog":
-                return await self._get_product_catalog(parameters)
-            elif tool_name == "get_product_details":
-                return await self._get_product_details(parameters)
-            elif tool_name == "check_inventory":
-                return await self._check_inventory(parameters)
-            elif tool_name == "search_products":
-                return await self._search_products(parameters)
-            elif tool_name == "create_cart":
-                return await self._create_cart(parameters)
-            elif tool_name == "update_cart":
-                return await self._update_cart(parameters)
-            else:
-                return {
-                    "success": False,
-                    "error": f"Unknown tool: {tool_name}"
-                }
+            return await getattr(self, handler_name)(parameters)
         except Exception as e:
             logger.error(f"Tool execution failed: {e}")
             return {
@@ -65,16 +79,14 @@ class VoiceAgentHandler:
         max_price = 0
         
         for product in products:
-            if hasattr(product, 'to_dict'):
-                product_dict = product.to_dict()
-            else:
-                product_dict = product.__dict__ if hasattr(product, '__dict__') else product
+            product_dict = self._as_dict(product)
+            price = self._get_product_price(product_dict)
             
             formatted_products.append({
                 "id": product_dict.get("id"),
                 "title": product_dict.get("title"),
                 "description": product_dict.get("body_html", ""),
-                "price": self._get_product_price(product_dict),
+                "price": price,
                 "vendor": product_dict.get("vendor"),
                 "product_type": product_dict.get("product_type"),
                 "available": self._is_product_available(product_dict)
@@ -83,7 +95,6 @@ class VoiceAgentHandler:
             if product_dict.get("product_type"):
                 categories.add(product_dict["product_type"])
             
-            price = self._get_product_price(product_dict)
             if price:
                 min_price = min(min_price, price)
                 max_price = max(max_price, price)
@@ -113,10 +124,7 @@ class VoiceAgentHandler:
         if not product:
             return {"success": False, "error": "Product not found"}
         
-        if hasattr(product, 'to_dict'):
-            product_dict = product.to_dict()
-        else:
-            product_dict = product.__dict__ if hasattr(product, '__dict__') else product
+        product_dict = self._as_dict(product)
         
         return {
             "success": True,
@@ -165,10 +173,7 @@ class VoiceAgentHandler:
         
         formatted_products = []
         for product in products:
-            if hasattr(product, 'to_dict'):
-                product_dict = product.to_dict()
-            else:
-                product_dict = product.__dict__ if hasattr(product, '__dict__') else product
+            product_dict = self._as_dict(product)
             
             formatted_products.append({
                 "id": product_dict.get("id"),
@@ -213,6 +218,15 @@ class VoiceAgentHandler:
             "cart": cart
         }
     
+    @staticmethod
+    def _as_dict(product: Any) -> Dict[str, Any]:
+        """Return product data as a dict without re-serializing plain dicts."""
+        if type(product) is dict:
+            return product
+        if hasattr(product, 'to_dict'):
+            return product.to_dict()
+        return product.__dict__ if hasattr(product, '__dict__') else product
+    
     def _get_product_price(self, product: Dict[str, Any]) -> Optional[float]:
         """Extract product price from product data."""
         variants = product.get("variants", [])
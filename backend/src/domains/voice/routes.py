@@ -1,13 +1,12 @@
 """Voice domain routes for Retell AI integration."""
 
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request
 from typing import Dict, Any, List
 from pydantic import BaseModel
 import logging
 
 from domains.voice.agent.optimized_agent import VoiceAgentHandler
 from domains.voice.tools.registry import ToolRegistry
-from integrations.retell.client import RetellClient
 
 
 router = APIRouter()
@@ -27,13 +26,22 @@ class RetellWebhookRequest(BaseModel):
     data: Dict[str, Any]
 
 
+def get_voice_handler() -> VoiceAgentHandler:
+    """Return the app-wide voice handler, or 503 before startup has run."""
+    from app import voice_handler
+    if voice_handler is None:
+        raise HTTPException(status_code=503, detail="Voice handler not initialized")
+    return voice_handler
+
+
 @router.post("/retell/tools")
-async def handle_retell_tool_call(request: RetellToolCall):
+async def handle_retell_tool_call(
+    request: RetellToolCall,
+    voice_handler: VoiceAgentHandler = Depends(get_voice_handler)
+):
     """Handle tool calls from Retell AI."""
     try:
-        from app import shopify_client
-        handler = VoiceAgentHandler(shopify_client)
-        result = await handler.execute_tool(
+        result = await voice_handler.execute_tool(
             tool_name=request.tool_name,
             parameters=request.parameters
         )
@@ -69,9 +77,8 @@ async def handle_retell_webhook(request: RetellWebhookRequest):
         parameters = data.get("parameters", {})
         call_id = data.get("call_id")
         
-        from app import shopify_client
-        handler = VoiceAgentHandler(shopify_client)
-        result = await handler.execute_tool(tool_name, parameters)
+        voice_handler = get_voice_handler()
+        result = await voice_handler.execute_tool(tool_name, parameters)
         
         return {
             "call_id": call_id,
@@ -101,7 +108,7 @@ async def configure_retell_agent(
 ):
     """Configure the Retell agent with our tools."""
     try:
-        retell_client = RetellClient()
+        from app import retell_client
         registry = ToolRegistry()
         
         tools = registry.get_tool_definitions()
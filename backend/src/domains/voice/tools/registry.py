@@ -1,149 +1,173 @@
 """Tool registry for Retell AI integration."""
 
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Tuple
 
 
-class ToolRegistry:
-    """Registry of available tools for the voice agent."""
+class _FrozenDict(dict):
+    """Read-only dict, still a dict for JSON encoders and type checks."""
     
-    @staticmethod
-    def get_tool_definitions() -> List[Dict[str, Any]]:
-        """Get all tool definitions for Retell AI configuration."""
-        return [
-            {
-                "name": "get_product_catalog",
-                "description": "Get a catalog of all available products",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "limit": {
-                            "type": "integer",
-                            "description": "Maximum number of products to return",
-                            "default": 50
-                        }
-                    }
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("tool definitions are read-only")
+    
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+    
+    def __copy__(self):
+        return self
+    
+    def __deepcopy__(self, memo):
+        return self
+    
+    def __reduce__(self):
+        return (_FrozenDict, (dict(self),))
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts and lists into read-only equivalents."""
+    if isinstance(value, dict):
+        return _FrozenDict((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# Schema fragments shared by several tool definitions
+_PRODUCT_ID_PARAMETER = {
+    "type": "string",
+    "description": "The ID of the product"
+}
+
+_CART_ITEM_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "variant_id": {
+            "type": "string",
+            "description": "Variant ID"
+        },
+        "quantity": {
+            "type": "integer",
+            "description": "Quantity"
+        }
+    }
+}
+
+# Built and frozen once at import; every nested dict and list is read-only,
+# so the shared fragments above cannot be changed through one tool
+_TOOL_DEFINITIONS: Tuple[Dict[str, Any], ...] = _freeze([
+    {
+        "name": "get_product_catalog",
+        "description": "Get a catalog of all available products",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of products to return",
+                    "default": 50
                 }
+            }
+        }
+    },
+    {
+        "name": "get_product_details",
+        "description": "Get detailed information about a specific product",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "product_id": _PRODUCT_ID_PARAMETER
             },
-            {
-                "name": "get_product_details",
-                "description": "Get detailed information about a specific product",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "product_id": {
-                            "type": "string",
-                            "description": "The ID of the product"
-                        }
-                    },
-                    "required": ["product_id"]
+            "required": ["product_id"]
+        }
+    },
+    {
+        "name": "check_inventory",
+        "description": "Check if a product is available in the requested quantity",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "product_id": _PRODUCT_ID_PARAMETER,
+                "variant_id": {
+                    "type": "string",
+                    "description": "The ID of the specific variant (optional)"
+                },
+                "quantity": {
+                    "type": "integer",
+                    "description": "The desired quantity",
+                    "default": 1
                 }
             },
-            {
-                "name": "check_inventory",
-                "description": "Check if a product is available in the requested quantity",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "product_id": {
-                            "type": "string",
-                            "description": "The ID of the product"
-                        },
-                        "variant_id": {
-                            "type": "string",
-                            "description": "The ID of the specific variant (optional)"
-                        },
-                        "quantity": {
-                            "type": "integer",
-                            "description": "The desired quantity",
-                            "default": 1
-                        }
-                    },
-                    "required": ["product_id"]
+            "required": ["product_id"]
+        }
+    },
+    {
+        "name": "search_products",
+        "description": "Search for products by keyword",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query"
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of results",
+                    "default": 10
                 }
             },
-            {
-                "name": "search_products",
-                "description": "Search for products by keyword",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "query": {
-                            "type": "string",
-                            "description": "Search query"
-                        },
-                        "limit": {
-                            "type": "integer",
-                            "description": "Maximum number of results",
-                            "default": 10
-                        }
-                    },
-                    "required": ["query"]
+            "required": ["query"]
+        }
+    },
+    {
+        "name": "create_cart",
+        "description": "Create a new shopping cart",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "items": {
+                    "type": "array",
+                    "description": "Initial cart items",
+                    "items": _CART_ITEM_SCHEMA
                 }
-            },
-            {
-                "name": "create_cart",
-                "description": "Create a new shopping cart",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "items": {
-                            "type": "array",
-                            "description": "Initial cart items",
-                            "items": {
-                                "type": "object",
-                                "properties": {
-                                    "variant_id": {
-                                        "type": "string",
-                                        "description": "Variant ID"
-                                    },
-                                    "quantity": {
-                                        "type": "integer",
-                                        "description": "Quantity"
-                                    }
-                                }
-                            }
-                        }
-                    }
+            }
+        }
+    },
+    {
+        "name": "update_cart",
+        "description": "Update an existing shopping cart",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "cart_id": {
+                    "type": "string",
+                    "description": "Cart ID"
+                },
+                "items": {
+                    "type": "array",
+                    "description": "Updated cart items",
+                    "items": _CART_ITEM_SCHEMA
                 }
             },
-            {
-                "name": "update_cart",
-                "description": "Update an existing shopping cart",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "cart_id": {
-                            "type": "string",
-                            "description": "Cart ID"
-                        },
-                        "items": {
-                            "type": "array",
-                            "description": "Updated cart items",
-                            "items": {
-                                "type": "object",
-                                "properties": {
-                                    "variant_id": {
-                                        "type": "string",
-                                        "description": "Variant ID"
-                                    },
-                                    "quantity": {
-                                        "type": "integer",
-                                        "description": "Quantity"
-                                    }
-                                }
-                            }
-                        }
-                    },
-                    "required": ["cart_id", "items"]
-                }
-            }
-        ]
+            "required": ["cart_id", "items"]
+        }
+    }
+])
+
+_TOOLS_BY_NAME: Mapping[str, Dict[str, Any]] = MappingProxyType({
+    tool["name"]: tool for tool in _TOOL_DEFINITIONS
+})
+
+
+class ToolRegistry:
+    """Registry of available tools for the voice agent."""
+    
+    @staticmethod
+    def get_tool_definitions() -> List[Dict[str, Any]]:
+        """Get all tool definitions for Retell AI configuration."""
+        return list(_TOOL_DEFINITIONS)
     
     @staticmethod
     def get_tool_by_name(tool_name: str) -> Optional[Dict[str, Any]]:
         """Get a specific tool definition by name."""
-        tools = ToolRegistry.get_tool_definitions()
-        for tool in tools:
-            if tool["name"] == tool_name:
-                return tool
-        return None
\ No newline at end of file
+        return _TOOLS_BY_NAME.get(tool_name)
\ No newline at end of file
@@ -1,6 +1,7 @@
 """Retell AI client integration."""
 
 import httpx
+import reprlib
 from typing import Dict, Any, Optional, List
 import logging
 from config import get_settings
@@ -8,6 +9,20 @@ from config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Bounded repr for logged tool parameters, so oversized strings and long cart
+# item lists are abbreviated instead of written out in full
+_PARAMETER_REPR = reprlib.Repr()
+_PARAMETER_REPR.maxlevel = 4
+_PARAMETER_REPR.maxdict = 10
+_PARAMETER_REPR.maxlist = 10
+_PARAMETER_REPR.maxstring = 200
+_PARAMETER_REPR.maxother = 200
+
+
+def loggable_parameters(parameters: Dict[str, Any]) -> str:
+    """Render tool parameters for logging with every value size-bounded."""
+    return _PARAMETER_REPR.repr(parameters)
+
 
 class RetellClient:
     """Client for Retell AI API integration."""
@@ -54,7 +69,12 @@ class RetellClient:
         call_id: str
     ) -> Dict[str, Any]:
         """Handle a tool call from Retell and return the response."""
-        logger.info(f"Handling Retell tool call: {tool_name} with params: {parameters}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Handling Retell tool call: %s with params: %s",
+                tool_name,
+                loggable_parameters(parameters)
+            )
         
         return {
             "call_id": call_id,
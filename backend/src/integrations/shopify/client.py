@@ -65,17 +65,17 @@ class ShopifyClient:
             matching_products = []
             
             for product in all_products:
-                title = product.get("title", "").lower()
-                body = product.get("body_html", "").lower()
-                vendor = product.get("vendor", "").lower()
-                product_type = product.get("product_type", "").lower()
-                tags = " ".join(product.get("tags", "").split(",")).lower()
+                # One lowercase pass and one substring scan per product;
+                # newlines keep a match from spanning two fields
+                searchable = "\n".join((
+                    product.get("title") or "",
+                    product.get("body_html") or "",
+                    product.get("vendor") or "",
+                    product.get("product_type") or "",
+                    (product.get("tags") or "").replace(",", " ")
+                )).lower()
                 
-                if (query_lower in title or 
-                    query_lower in body or 
-                    query_lower in vendor or
-                    query_lower in product_type or
-                    query_lower in tags):
+                if query_lower in searchable:
                     matching_products.append(product)
                     
                 if len(matching_products) >= limit:
@@ -96,6 +96,8 @@ class ShopifyClient:
             data = response.json()
             
             custom_collections = data.get("custom_collections", [])
+            # Fresh list so the decoded response is left untouched
+            all_collections = list(custom_collections)
             
             # Also get smart collections
             response = await self.client.get(
@@ -103,10 +105,9 @@ class ShopifyClient:
             )
             if response.status_code == 200:
                 data = response.json()
-                smart_collections = data.get("smart_collections", [])
-                return custom_collections + smart_collections
+                all_collections.extend(data.get("smart_collections", []))
             
-            return custom_collections
+            return all_collections
         except Exception as e:
             logger.error(f"Failed to fetch collections: {e}")
             return []
@@ -114,11 +115,13 @@ class ShopifyClient:
     async def check_inventory(
         self,
         product_id: str,
-        variant_id: Optional[str] = None
+        variant_id: Optional[str] = None,
+        product: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
-        """Check inventory for a product."""
+        """Check inventory for a product, reusing `product` if already fetched."""
         try:
-            product = await self.get_product(product_id)
+            if product is None:
+                product = await self.get_product(product_id)
             if not product:
                 return {"available": False, "error": "Product not found"}
             
@@ -126,14 +126,8 @@ class TestProductCatalog:
         products = result.data
         
         # Check for variety in product types
-        product_types = set()
-        vendors = set()
-        
-        for product in products:
-            if product.product_type:
-                product_types.add(product.product_type.lower())
-            if product.vendor:
-                vendors.add(product.vendor.lower())
+        product_types = {p.product_type.lower() for p in products if p.product_type}
+        vendors = {p.vendor.lower() for p in products if p.vendor}
         
         print(f"Product types found: {len(product_types)}")
         print(f"Vendors found: {len(vendors)}")
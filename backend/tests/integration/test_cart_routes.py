@@ -0,0 +1,96 @@
+"""Integration tests for carts shared across API requests."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture
+def app_module(monkeypatch):
+    """Import the app with placeholder Shopify credentials."""
+    monkeypatch.setenv("SHOPIFY_STORE_URL", "test-store.myshopify.com")
+    monkeypatch.setenv("SHOPIFY_ACCESS_TOKEN", "test-token")
+    import app
+    return app
+
+
+@pytest.fixture
+def client(app_module):
+    """Test client running the app lifespan."""
+    with TestClient(app_module.app) as test_client:
+        yield test_client
+
+
+class TestSharedCartService:
+    """Test carts persist in the app-wide cart service."""
+
+    def test_create_then_get_cart(self, client):
+        """A cart created over REST can be fetched by a later request."""
+        response = client.post(
+            "/api/shopify/carts",
+            json=[{"variant_id": "1", "quantity": 2}]
+        )
+        assert response.status_code == 200
+        cart = response.json()
+
+        response = client.get(f"/api/shopify/carts/{cart['id']}")
+        assert response.status_code == 200
+        assert response.json()["items"] == cart["items"]
+
+    def test_voice_cart_visible_to_app_cart_service(self, client, app_module):
+        """A cart created by the voice handler is stored in app.cart_service."""
+        response = client.post(
+            "/api/voice/retell/tools",
+            json={
+                "tool_name": "create_cart",
+                "call_id": "call_1",
+                "parameters": {"items": [{"variant_id": "9", "quantity": 1}]}
+            }
+        )
+        assert response.status_code == 200
+        cart_id = response.json()["result"]["cart"]["id"]
+
+        assert app_module.voice_handler.cart_service is app_module.cart_service
+        assert cart_id in app_module.cart_service.carts
+
+        response = client.get(f"/api/shopify/carts/{cart_id}")
+        assert response.status_code == 200
+
+
+class TestServicesNotInitialized:
+    """Test routes answer 503 when the app lifespan has not run."""
+
+    @pytest.fixture
+    def bare_client(self, app_module, monkeypatch):
+        """Test client without lifespan startup and with no shared services."""
+        monkeypatch.setattr(app_module, "cart_service", None)
+        monkeypatch.setattr(app_module, "voice_handler", None)
+        return TestClient(app_module.app)
+
+    def test_cart_routes_return_503(self, bare_client):
+        """Cart routes report the missing cart service instead of failing."""
+        response = bare_client.post("/api/shopify/carts", json=[])
+        assert response.status_code == 503
+
+        response = bare_client.get("/api/shopify/carts/missing")
+        assert response.status_code == 503
+        assert response.json()["detail"] == "Cart service not initialized"
+
+    def test_tool_routes_return_503(self, bare_client):
+        """Tool calls report the missing voice handler instead of failing."""
+        response = bare_client.post(
+            "/api/voice/retell/tools",
+            json={"tool_name": "create_cart", "call_id": "call_1", "parameters": {}}
+        )
+        assert response.status_code == 503
+
+        response = bare_client.post(
+            "/api/voice/retell/webhook",
+            json={"event": "tool.called", "data": {"tool_name": "create_cart"}}
+        )
+        assert response.status_code == 503
+
+        response = bare_client.post(
+            "/api/voice/retell/webhook",
+            json={"event": "call.started", "data": {"call_id": "call_1"}}
+        )
+        assert response.status_code == 200
@@ -0,0 +1,85 @@
+"""Unit tests for the in-memory cart service."""
+
+import logging
+
+import pytest
+
+from domains.shopify.services.carts import CartService
+
+
+class FakeShopifyClient:
+    """Shopify client stand-in serving a single priced product."""
+
+    async def get_product(self, product_id):
+        return {
+            "id": product_id,
+            "title": "Cloud Hoodie",
+            "variants": [{"id": "v1", "title": "M", "price": "50.00"}]
+        }
+
+    async def create_draft_order(self, line_items):
+        return {"id": "draft_1", "line_items": line_items}
+
+
+@pytest.fixture
+def cart_service():
+    """Cart service capped at two carts."""
+    return CartService(FakeShopifyClient(), max_carts=2)
+
+
+class TestCartEviction:
+    """Test least recently used eviction at an opt-in cart cap."""
+
+    @pytest.mark.asyncio
+    async def test_oldest_cart_evicted_past_cap(self, cart_service, caplog):
+        """Creating a cart past the cap evicts the oldest one and logs it."""
+        first = await cart_service.create_cart()
+        second = await cart_service.create_cart()
+
+        with caplog.at_level(logging.INFO, logger="domains.shopify.services.carts"):
+            third = await cart_service.create_cart()
+
+        assert list(cart_service.carts) == [second["id"], third["id"]]
+        assert await cart_service.get_cart(first["id"]) is None
+        assert f"Evicted cart {first['id']}" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_updated_cart_survives_eviction(self, cart_service):
+        """Updating a cart makes it most recent, so the other one is evicted."""
+        first = await cart_service.create_cart()
+        second = await cart_service.create_cart()
+
+        items = [{"product_id": "p1", "variant_id": "v1", "quantity": 2}]
+        updated = await cart_service.update_cart(first["id"], items)
+        assert updated["total"] == 100.0
+
+        third = await cart_service.create_cart()
+
+        assert list(cart_service.carts) == [first["id"], third["id"]]
+        assert await cart_service.get_cart(second["id"]) is None
+
+    @pytest.mark.asyncio
+    async def test_read_cart_survives_eviction(self, cart_service):
+        """Reading a cart counts as use, so it can still be checked out."""
+        first = await cart_service.create_cart(
+            [{"product_id": "p1", "variant_id": "v1", "quantity": 1}]
+        )
+        second = await cart_service.create_cart()
+
+        assert await cart_service.get_cart(first["id"]) is first
+        await cart_service.create_cart()
+
+        assert await cart_service.get_cart(second["id"]) is None
+        order = await cart_service.checkout_cart(first["id"])
+        assert order["id"] == "draft_1"
+        assert await cart_service.get_cart(first["id"]) is None
+
+    @pytest.mark.asyncio
+    async def test_unbounded_by_default(self):
+        """Without max_carts no cart is ever evicted."""
+        cart_service = CartService(FakeShopifyClient())
+        assert cart_service.max_carts is None
+
+        carts = [await cart_service.create_cart() for _ in range(5)]
+
+        assert list(cart_service.carts) == [cart["id"] for cart in carts]
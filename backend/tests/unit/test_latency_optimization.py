@@ -3,6 +3,7 @@
 import asyncio
 import websockets
 import json
+import statistics
 import time
 from datetime import datetime
 
@@ -35,11 +36,13 @@ async def test_latency():
             "Do you have any running shoes?"
         ]
         
+        response_times = []
+        
         for query in test_queries:
             print(f"\n📝 Testing query: '{query}'")
             
             # Track timing
-            start_time = time.time()
+            start_time = time.perf_counter()
             first_chunk_time = None
             first_audio_time = None
             chunks_received = 0
@@ -57,7 +60,7 @@ async def test_latency():
             while True:
                 response = await websocket.recv()
                 data = json.loads(response)
-                current_time = time.time() - start_time
+                current_time = time.perf_counter() - start_time
                 
                 if data["type"] == "text.chunk":
                     chunks_received += 1
@@ -72,7 +75,8 @@ async def test_latency():
                         print(f"🎵 First audio chunk: {current_time:.2f}s")
                     
                 elif data["type"] == "agent.response":
-                    total_time = time.time() - start_time
+                    total_time = time.perf_counter() - start_time
+                    response_times.append(total_time)
                     print(f"✅ Complete: {total_time:.2f}s")
                     print(f"   Text chunks: {chunks_received}")
                     print(f"   Audio chunks: {audio_chunks_received}")
@@ -94,9 +98,9 @@ async def test_latency():
                 elif data["type"] == "error":
                     print(f"❌ Error: {data['data']['message']}")
                     break
-            
-            # Small delay between queries
-            await asyncio.sleep(1)
+        
+        if response_times:
+            print(f"\n📊 Median response time: {statistics.median(response_times):.2f}s")
     
     print("\n" + "=" * 50)
     print("🏁 Latency test complete!")
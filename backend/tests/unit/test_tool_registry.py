@@ -0,0 +1,81 @@
+"""Unit tests for the Retell tool registry."""
+
+import json
+import timeit
+
+import pytest
+
+from domains.voice.tools.registry import ToolRegistry
+
+
+def _thaw(value):
+    """Rebuild definitions as fresh dicts and lists, like the original getter."""
+    if isinstance(value, dict):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_thaw(item) for item in value]
+    return value
+
+
+class TestToolDefinitions:
+    """Test tool definitions are built once and cannot be changed by callers."""
+
+    def test_definitions_serialize_to_json(self):
+        """Definitions round-trip through JSON for Retell and API responses."""
+        tools = ToolRegistry.get_tool_definitions()
+        names = [tool["name"] for tool in json.loads(json.dumps(tools))]
+
+        assert names == [
+            "get_product_catalog",
+            "get_product_details",
+            "check_inventory",
+            "search_products",
+            "create_cart",
+            "update_cart"
+        ]
+
+    def test_nested_definitions_are_read_only(self):
+        """Shared schema fragments cannot be changed through any tool."""
+        tools = ToolRegistry.get_tool_definitions()
+        details = tools[1]["parameters"]["properties"]["product_id"]
+
+        with pytest.raises(TypeError):
+            details["description"] = "changed"
+        with pytest.raises(TypeError):
+            tools[2]["parameters"].update(required=[])
+        with pytest.raises(AttributeError):
+            tools[5]["parameters"]["required"].append("extra")
+
+        inventory = ToolRegistry.get_tool_definitions()[2]
+        assert inventory["parameters"]["properties"]["product_id"]["description"] == (
+            "The ID of the product"
+        )
+
+    def test_outer_list_is_fresh(self):
+        """Callers get their own list but share the frozen definitions."""
+        first = ToolRegistry.get_tool_definitions()
+        first.clear()
+
+        second = ToolRegistry.get_tool_definitions()
+        assert len(second) == 6
+        assert second[0] is ToolRegistry.get_tool_definitions()[0]
+
+    def test_definitions_faster_than_rebuilding(self):
+        """Serving the prebuilt definitions beats rebuilding them per call."""
+        frozen = ToolRegistry.get_tool_definitions()
+
+        served = min(timeit.repeat(
+            ToolRegistry.get_tool_definitions, number=2000, repeat=5
+        ))
+        rebuilt = min(timeit.repeat(lambda: _thaw(frozen), number=2000, repeat=5))
+
+        assert served * 5 < rebuilt
+
+    def test_get_tool_by_name_returns_shared_read_only_definition(self):
+        """Lookups return the frozen definition from the index."""
+        tool = ToolRegistry.get_tool_by_name("check_inventory")
+
+        assert tool is ToolRegistry.get_tool_definitions()[2]
+        assert ToolRegistry.get_tool_by_name("unknown_tool") is None
+        with pytest.raises(TypeError):
+            tool["parameters"]["properties"]["product_id"]["description"] = "changed"
@@ -1,5 +1,7 @@
 """Unit tests for tools."""
 
+import re
+
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 
@@ -9,6 +11,21 @@ from orchestration.tools.product_tools import GetProductCatalogTool, GetProductD
 from shared import Product
 
 
+_MISSING_RE = re.compile(r"Missing required parameters")
+
+
+@pytest.fixture(scope="module")
+def catalog_tool():
+    """Product catalog tool shared across the module."""
+    return GetProductCatalogTool()
+
+
+@pytest.fixture(scope="module")
+def details_tool():
+    """Product details tool shared across the module."""
+    return GetProductDetailsTool()
+
+
 class TestBaseTool:
     """Test base tool functionality."""
     
@@ -48,13 +65,20 @@ class TestBaseTool:
         assert tool.validate_parameters({"required_param": "value"}) is True
         
         # Should fail without required parameter
-        with pytest.raises(ValueError, match="Missing required parameters"):
+        with pytest.raises(ValueError, match=_MISSING_RE):
             tool.validate_parameters({})
 
 
 class TestToolRegistry:
     """Test tool registry."""
     
+    @pytest.fixture(autouse=True)
+    def isolated_registry(self):
+        """Give each test an empty registry and restore the original tools after."""
+        registry = ToolRegistry()
+        with patch.dict(registry._tools, clear=True):
+            yield registry
+    
     def test_singleton_pattern(self):
         """Test registry is a singleton."""
         registry1 = ToolRegistry()
@@ -65,7 +89,6 @@ class TestToolRegistry:
     def test_register_and_get_tool(self):
         """Test registering and retrieving tools."""
         registry = ToolRegistry()
-        registry.clear()
         
         class TestTool(BaseTool):
             name = "test_tool"
@@ -81,7 +104,6 @@ class TestToolRegistry:
     def test_get_by_category(self):
         """Test getting tools by category."""
         registry = ToolRegistry()
-        registry.clear()
         
         class ProductTool(BaseTool):
             name = "product_tool"
@@ -106,7 +128,6 @@ class TestToolRegistry:
     async def test_execute_tool(self):
         """Test executing tool through registry."""
         registry = ToolRegistry()
-        registry.clear()
         
         class TestTool(BaseTool):
             name = "test_tool"
@@ -124,11 +145,9 @@ class TestGetProductCatalogTool:
     """Test product catalog tool."""
     
     @pytest.mark.asyncio
-    async def test_get_catalog_mock(self):
+    async def test_get_catalog_mock(self, catalog_tool):
         """Test getting product catalog with mock data."""
-        tool = GetProductCatalogTool()
-        
-        result = await tool.execute(limit=5)
+        result = await catalog_tool.execute(limit=5)
         
         assert result.success is True
         assert isinstance(result.data, list)
@@ -141,11 +160,9 @@ class TestGetProductCatalogTool:
             assert product.title
     
     @pytest.mark.asyncio
-    async def test_catalog_with_limit(self):
+    async def test_catalog_with_limit(self, catalog_tool):
         """Test catalog with custom limit."""
-        tool = GetProductCatalogTool()
-        
-        result = await tool.execute(limit=10)
+        result = await catalog_tool.execute(limit=10)
         
         assert result.success is True
         assert isinstance(result.data, list)
@@ -157,11 +174,9 @@ class TestGetProductCatalogTool:
         assert result.metadata["catalog_type"] == "full_products"
     
     @pytest.mark.asyncio
-    async def test_default_limit(self):
+    async def test_default_limit(self, catalog_tool):
         """Test catalog with default limit."""
-        tool = GetProductCatalogTool()
-        
-        result = await tool.execute()
+        result = await catalog_tool.execute()
         
         assert result.success is True
         assert isinstance(result.data, list)
@@ -175,11 +190,9 @@ class TestGetProductDetailsTool:
     """Test product details tool."""
     
     @pytest.mark.asyncio
-    async def test_get_product_details_mock(self):
+    async def test_get_product_details_mock(self, details_tool):
         """Test getting product details with mock data."""
-        tool = GetProductDetailsTool()
-        
-        result = await tool.execute(
+        result = await details_tool.execute(
             product_id="prod_001",
             include_inventory=True
         )
@@ -193,11 +206,9 @@ class TestGetProductDetailsTool:
         assert "variants" in product
     
     @pytest.mark.asyncio
-    async def test_product_not_found(self):
+    async def test_product_not_found(self, details_tool):
         """Test handling of non-existent product."""
-        tool = GetProductDetailsTool()
-        
-        result = await tool.execute(
+        result = await details_tool.execute(
             product_id="non_existent",
             include_inventory=False
         )
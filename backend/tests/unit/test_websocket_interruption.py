@@ -1,11 +1,33 @@
 """Test WebSocket interruption functionality."""
 
+import functools
+import inspect
+
 import pytest
 from unittest.mock import Mock
 
 from infrastructure.api.routes import SimpleInterruptManager
 
 
+# Message types and interrupt manager calls voice_session must reference
+REQUIRED_HANDLER_TOKENS = (
+    'interrupt.speech',
+    'user.speaking',
+    'speech.interrupted',
+    'interrupt_manager',
+    'register_session',
+    'interrupt_session',
+    'cleanup_session',
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _voice_session_source() -> str:
+    """Read the voice_session handler source once per interpreter."""
+    from infrastructure.api.routes import voice_session
+    return inspect.getsource(voice_session)
+
+
 class TestSimpleInterruptManager:
     """Test the simple interrupt manager."""
 
@@ -92,18 +114,7 @@ class TestWebSocketMessageTypes:
 
     def test_websocket_has_interrupt_handlers(self):
         """Verify WebSocket handler contains interrupt message types."""
-        from infrastructure.api.routes import voice_session
-        import inspect
-        
-        source = inspect.getsource(voice_session)
-        
-        # Check for required message types
-        assert 'interrupt.speech' in source
-        assert 'user.speaking' in source
-        assert 'speech.interrupted' in source
+        source = _voice_session_source()
         
-        # Check for interrupt manager usage
-        assert 'interrupt_manager' in source
-        assert 'register_session' in source
-        assert 'interrupt_session' in source
-        assert 'cleanup_session' in source
\ No newline at end of file
+        missing = [token for token in REQUIRED_HANDLER_TOKENS if token not in source]
+        assert not missing, f"voice_session is missing: {missing}"
\ No newline at end of file